@@ -5,6 +5,8 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+import sys
+
 from .. import util
 
 __all__ = ('oracle', 'sqlite',)
@@ -23,16 +25,16 @@ def _auto_fn(name):
         dialect = name
         driver = "base"
 
+    modname = 'sqlalchemy.dialects.' + dialect
     try:
-        module = __import__(
-            'sqlalchemy.dialects.{0!s}'.format(dialect)).dialects
+        __import__(modname)
     except ImportError:
         return None
 
-    module = getattr(module, dialect)
+    module = sys.modules[modname]
     if hasattr(module, driver):
-        module = getattr(module, driver)
-        return lambda: module.dialect
+        dialect_cls = getattr(module, driver).dialect
+        return lambda: dialect_cls
     else:
         return None
 
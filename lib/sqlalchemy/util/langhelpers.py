@@ -189,13 +189,19 @@ class PluginLoader(object):
         self.auto_fn = auto_fn
 
     def load(self, name):
-        if name in self.impls:
-            return self.impls[name]()
+        impls = self.impls
+        try:
+            loader = impls[name]
+        except KeyError:
+            pass
+        else:
+            return loader()
 
-        if self.auto_fn:
-            loader = self.auto_fn(name)
+        auto_fn = self.auto_fn
+        if auto_fn:
+            loader = auto_fn(name)
             if loader:
-                self.impls[name] = loader
+                impls[name] = loader
                 return loader()
 
         try:
@@ -204,7 +210,7 @@ class PluginLoader(object):
             pass
         else:
             for impl in pkg_resources.iter_entry_points(self.group, name):
-                self.impls[name] = impl.load
+                impls[name] = impl.load
                 return impl.load()
 
         raise exc.NoSuchModuleError(